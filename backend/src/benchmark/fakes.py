@@ -0,0 +1,116 @@
+import sys
+import threading
+import types
+from typing import Dict, Iterator, List, Optional
+
+
+# In-process stand-ins for the Firestore client and Storage bucket exposed by
+# backend.src.firebase_utils. They implement only the calls made by the API and
+# the moderator, and are thread-safe because the moderation path runs blocking
+# code that may be moved to worker threads.
+
+
+class FakeDocumentSnapshot:
+    def __init__(self, doc_id: str, data: Optional[dict]):
+        self.id = doc_id
+        self._data = data
+
+    @property
+    def exists(self) -> bool:
+        return self._data is not None
+
+    def to_dict(self) -> Optional[dict]:
+        return dict(self._data) if self._data is not None else None
+
+
+class FakeDocumentReference:
+    def __init__(self, collection: "FakeCollection", doc_id: str):
+        self._collection = collection
+        self.id = doc_id
+
+    def set(self, data: dict):
+        with self._collection.lock:
+            self._collection.documents[self.id] = dict(data)
+
+    def get(self) -> FakeDocumentSnapshot:
+        with self._collection.lock:
+            return FakeDocumentSnapshot(self.id, self._collection.documents.get(self.id))
+
+    def delete(self):
+        with self._collection.lock:
+            self._collection.documents.pop(self.id, None)
+
+
+class FakeCollection:
+    def __init__(self, name: str):
+        self.name = name
+        self.documents: Dict[str, dict] = {}
+        self.lock = threading.Lock()
+
+    def document(self, doc_id: str) -> FakeDocumentReference:
+        return FakeDocumentReference(self, doc_id)
+
+    def get(self) -> List[FakeDocumentSnapshot]:
+        with self.lock:
+            return [FakeDocumentSnapshot(doc_id, data) for doc_id, data in self.documents.items()]
+
+    def stream(self) -> Iterator[FakeDocumentSnapshot]:
+        return iter(self.get())
+
+
+class FakeFirestore:
+    def __init__(self):
+        self._collections: Dict[str, FakeCollection] = {}
+        self._lock = threading.Lock()
+
+    def collection(self, name: str) -> FakeCollection:
+        with self._lock:
+            if name not in self._collections:
+                self._collections[name] = FakeCollection(name)
+            return self._collections[name]
+
+
+class FakeBlob:
+    def __init__(self, bucket: "FakeBucket", name: str):
+        self._bucket = bucket
+        self.name = name
+        self.public_url: Optional[str] = None
+
+    def upload_from_file(self, file_obj, content_type: Optional[str] = None):
+        data = file_obj.read()
+        with self._bucket.lock:
+            self._bucket.blobs[self.name] = (data, content_type)
+
+    def make_public(self):
+        self.public_url = f"https://storage.fake/{self._bucket.name}/{self.name}"
+
+
+class FakeBucket:
+    def __init__(self, name: str = "bench-bucket"):
+        self.name = name
+        self.blobs: Dict[str, tuple] = {}
+        self.lock = threading.Lock()
+
+    def blob(self, name: str) -> FakeBlob:
+        return FakeBlob(self, name)
+
+    @property
+    def stored_bytes(self) -> int:
+        with self.lock:
+            return sum(len(data) for data, _ in self.blobs.values())
+
+
+def install_fake_firebase() -> types.ModuleType:
+    """
+    Registers a fake `backend.src.firebase_utils` module so that importing the
+    API or the moderator does not initialise firebase_admin.
+    Must be called before `backend.src.main` is imported.
+
+    Returns:
+        - ModuleType: The fake module, exposing `db` and `bucket`.
+    """
+    module = types.ModuleType("backend.src.firebase_utils")
+    module.db = FakeFirestore()
+    module.bucket = FakeBucket()
+    sys.modules["backend.src.firebase_utils"] = module
+    return module
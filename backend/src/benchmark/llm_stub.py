@@ -0,0 +1,115 @@
+import json
+import random
+import threading
+import time
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from logging import getLogger
+from uuid import uuid4
+
+logger = getLogger(__name__)
+
+# Model used by the moderator for the final flag/no-flag decision; it expects JSON.
+DECISION_MODEL = "gpt-4o-mini"
+
+
+class LLMStub:
+    """
+    Local OpenAI-compatible server answering POST /v1/chat/completions.
+
+    The vision model gets a canned reasoning string and the decision model gets
+    `{"action": ...}`, flagged with probability `flag_rate`. Every call sleeps for
+    `latency` seconds (plus up to `jitter` seconds) to emulate the remote API.
+    """
+
+    def __init__(self, latency: float = 0.0, jitter: float = 0.0, flag_rate: float = 0.0,
+                 seed: int = 0, host: str = "127.0.0.1", port: int = 0):
+        self.latency = latency
+        self.jitter = jitter
+        self.flag_rate = flag_rate
+        self.calls = Counter()
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer((host, port), self._make_handler())
+        self._server.daemon_threads = True
+        self._thread = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}/v1"
+
+    @property
+    def total_calls(self) -> int:
+        with self._lock:
+            return sum(self.calls.values())
+
+    def start(self) -> "LLMStub":
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        logger.info(f"LLM stub listening on {self.base_url}")
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self) -> "LLMStub":
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    def _completion(self, request: dict) -> dict:
+        model = request.get("model", "")
+        with self._lock:
+            self.calls[model] += 1
+            delay = self.latency + self._random.uniform(0, self.jitter)
+            flagged = self._random.random() < self.flag_rate
+
+        time.sleep(delay)
+
+        if model == DECISION_MODEL:
+            content = json.dumps({"action": flagged})
+        else:
+            content = "The listing matches none of the exclusions and does not contain inappropriate content."
+
+        return {
+            "id": f"chatcmpl-{uuid4().hex}",
+            "object": "chat.completion",
+            "created": int(time.time()),
+            "model": model,
+            "choices": [
+                {
+                    "index": 0,
+                    "message": {"role": "assistant", "content": content},
+                    "finish_reason": "stop",
+                }
+            ],
+            "usage": {"prompt_tokens": 0, "completion_tokens": 0, "total_tokens": 0},
+        }
+
+    def _make_handler(self):
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self):
+                length = int(self.headers.get("Content-Length", 0))
+                body = self.rfile.read(length)
+
+                if not self.path.rstrip("/").endswith("/chat/completions"):
+                    self.send_error(404)
+                    return
+
+                payload = json.dumps(stub._completion(json.loads(body or b"{}"))).encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def log_message(self, format, *args):
+                # Keep per-request access logs out of the benchmark output
+                pass
+
+        return Handler
@@ -0,0 +1,245 @@
+"""
+Load test and benchmark for the FastAPI app in backend.src.main.
+
+Drives the app in-process with concurrent synthetic listings, using the fakes in
+backend.src.benchmark.fakes in place of Firebase and a local OpenAI-compatible stub
+in place of the OpenAI API. Reports throughput, p50/p95/p99 latency per endpoint,
+peak RSS and LLM calls per listing.
+
+Usage (from the repository root):
+    python -m backend.src.benchmark.load_test --listings 200 --concurrency 16 --llm-latency 0.5
+"""
+import argparse
+import asyncio
+import json
+import math
+import os
+import random
+import resource
+import sys
+import time
+from collections import defaultdict
+from logging import getLogger
+from typing import Dict, List, Optional
+
+import httpx
+
+from backend.src.benchmark.fakes import install_fake_firebase
+from backend.src.benchmark.llm_stub import LLMStub
+
+logger = getLogger(__name__)
+
+SAMPLE_IMAGE_PATH = os.path.join(os.path.dirname(__file__), "..", "moderator", "test", "rolex.jpg")
+
+SEED_RULES = [
+    "No weapons or ammunition.",
+    "No counterfeit luxury goods.",
+    "No live animals.",
+    "No prescription drugs.",
+]
+
+ITEMS = ["Watch", "Bicycle", "Lamp", "Guitar", "Camera", "Sofa", "Jacket", "Laptop"]
+CONDITIONS = ["brand new", "lightly used", "in excellent condition", "with minor scratches"]
+
+
+def load_app(llm_base_url: str):
+    """
+    Imports the FastAPI app with fake Firebase clients and the OpenAI client
+    pointed at the local stub.
+
+    Args:
+        - llm_base_url (str): Base URL of the OpenAI-compatible stub.
+
+    Returns:
+        - tuple: The FastAPI app and the fake firebase_utils module.
+    """
+    if "backend.src.main" in sys.modules:
+        raise RuntimeError("backend.src.main was imported before the fakes were installed.")
+
+    # Set before import: the moderator validates the API key at import time and
+    # load_dotenv does not override variables that are already set.
+    os.environ["OPENAI_API_KEY"] = "bench-key"
+    os.environ["OPENAI_BASE_URL"] = llm_base_url
+    os.environ["OPENAI_API_BASE"] = llm_base_url
+
+    firebase = install_fake_firebase()
+    from backend.src.main import app
+
+    return app, firebase
+
+
+def make_image(rng: random.Random, size: int, sample: bytes) -> bytes:
+    """
+    Returns the sample image, or a synthetic JPEG-framed payload of `size` bytes.
+    The stub never decodes images, so only the payload size matters.
+    """
+    if size <= 0:
+        return sample
+    return b"\xff\xd8" + rng.randbytes(max(size - 4, 0)) + b"\xff\xd9"
+
+
+def make_listing(rng: random.Random, index: int) -> dict:
+    item = rng.choice(ITEMS)
+    return {
+        "title": f"{item} #{index}",
+        "description": f"A {item.lower()} {rng.choice(CONDITIONS)}.",
+        "price": f"{rng.uniform(5, 2000):.2f}",
+    }
+
+
+def percentile(samples: List[float], pct: float) -> float:
+    """Nearest-rank percentile of `samples`."""
+    ordered = sorted(samples)
+    rank = max(math.ceil(pct / 100 * len(ordered)), 1)
+    return ordered[rank - 1]
+
+
+def peak_rss_mb() -> float:
+    # ru_maxrss is reported in kilobytes on Linux and in bytes on macOS
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+class Recorder:
+    """Collects request latencies and failures keyed by endpoint."""
+
+    def __init__(self):
+        self.latencies: Dict[str, List[float]] = defaultdict(list)
+        self.errors: Dict[str, int] = defaultdict(int)
+
+    async def request(self, client, endpoint: str, method: str, url: str, **kwargs):
+        start = time.perf_counter()
+        try:
+            response = await client.request(method, url, **kwargs)
+        except Exception as e:
+            self.errors[endpoint] += 1
+            logger.error(f"{endpoint} failed: {e}")
+            return None
+        self.latencies[endpoint].append(time.perf_counter() - start)
+        if response.status_code >= 400:
+            self.errors[endpoint] += 1
+            return None
+        return response.json()
+
+
+async def run_listing(client, recorder: Recorder, listing: dict, image: bytes) -> bool:
+    """
+    Runs one synthetic listing through the API: moderation, direct submission,
+    reads, and removal of the directly submitted copy.
+
+    Returns:
+        - bool: Whether the listing was checked successfully.
+    """
+    files = {"image": ("listing.jpg", image, "image/jpeg")}
+    checked = await recorder.request(client, "POST /check-listing", "POST", "/check-listing",
+                                     data=listing, files=files)
+
+    created = await recorder.request(client, "POST /listing", "POST", "/listing",
+                                     data={**listing, "reasoning": "Submitted by load test."}, files=files)
+
+    await recorder.request(client, "GET /listings", "GET", "/listings")
+    await recorder.request(client, "GET /rules", "GET", "/rules")
+
+    if created:
+        await recorder.request(client, "DELETE /listing/{listing_id}", "DELETE", f"/listing/{created['id']}")
+
+    return checked is not None
+
+
+async def run_benchmark(app, listings: int, concurrency: int, image_size: int, seed: int) -> dict:
+    rng = random.Random(seed)
+    with open(SAMPLE_IMAGE_PATH, "rb") as f:
+        sample = f.read()
+
+    recorder = Recorder()
+    semaphore = asyncio.Semaphore(concurrency)
+    transport = httpx.ASGITransport(app=app)
+
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=None) as client:
+        # Seed the rules outside the timed window so they do not skew throughput
+        for rule in SEED_RULES:
+            response = await client.post("/rule", json={"content": rule})
+            response.raise_for_status()
+
+        jobs = [(make_listing(rng, i), make_image(rng, image_size, sample)) for i in range(listings)]
+
+        async def worker(listing: dict, image: bytes) -> bool:
+            async with semaphore:
+                return await run_listing(client, recorder, listing, image)
+
+        start = time.perf_counter()
+        results = await asyncio.gather(*(worker(listing, image) for listing, image in jobs))
+        elapsed = time.perf_counter() - start
+
+    return {
+        "elapsed": elapsed,
+        "checked": sum(results),
+        "latencies": recorder.latencies,
+        "errors": recorder.errors,
+    }
+
+
+def build_report(run: dict, llm: LLMStub, listings: int, concurrency: int) -> dict:
+    endpoints = {}
+    for endpoint, samples in sorted(run["latencies"].items()):
+        endpoints[endpoint] = {
+            "requests": len(samples),
+            "errors": run["errors"].get(endpoint, 0),
+            "p50_ms": percentile(samples, 50) * 1000,
+            "p95_ms": percentile(samples, 95) * 1000,
+            "p99_ms": percentile(samples, 99) * 1000,
+        }
+
+    total_requests = sum(len(samples) for samples in run["latencies"].values())
+    return {
+        "listings": listings,
+        "concurrency": concurrency,
+        "elapsed_s": run["elapsed"],
+        "listings_per_s": listings / run["elapsed"] if run["elapsed"] else 0.0,
+        "requests_per_s": total_requests / run["elapsed"] if run["elapsed"] else 0.0,
+        "peak_rss_mb": peak_rss_mb(),
+        "llm_calls": dict(llm.calls),
+        "llm_calls_per_listing": llm.total_calls / run["checked"] if run["checked"] else 0.0,
+        "endpoints": endpoints,
+    }
+
+
+def print_report(report: dict):
+    print(f"Listings: {report['listings']} (concurrency {report['concurrency']}) in {report['elapsed_s']:.2f}s")
+    print(f"Throughput: {report['listings_per_s']:.2f} listings/s, {report['requests_per_s']:.2f} requests/s")
+    print(f"Peak RSS: {report['peak_rss_mb']:.1f} MB")
+    print(f"LLM calls per listing: {report['llm_calls_per_listing']:.2f} {report['llm_calls']}")
+    print()
+    print(f"{'endpoint':<32}{'requests':>10}{'errors':>8}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}")
+    for endpoint, stats in report["endpoints"].items():
+        print(f"{endpoint:<32}{stats['requests']:>10}{stats['errors']:>8}"
+              f"{stats['p50_ms']:>10.1f}{stats['p95_ms']:>10.1f}{stats['p99_ms']:>10.1f}")
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description="Benchmark the listing API with stubbed Firebase and LLM.")
+    parser.add_argument("--listings", type=int, default=100, help="Number of synthetic listings.")
+    parser.add_argument("--concurrency", type=int, default=8, help="Listings processed concurrently.")
+    parser.add_argument("--image-size", type=int, default=0,
+                        help="Synthetic image size in bytes (0 uses the sample rolex.jpg).")
+    parser.add_argument("--llm-latency", type=float, default=0.2, help="Seconds the LLM stub waits per call.")
+    parser.add_argument("--llm-jitter", type=float, default=0.0, help="Extra random seconds per LLM call.")
+    parser.add_argument("--flag-rate", type=float, default=0.1, help="Fraction of listings the stub flags.")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="Write the report as JSON to this path.")
+    args = parser.parse_args(argv)
+
+    with LLMStub(latency=args.llm_latency, jitter=args.llm_jitter, flag_rate=args.flag_rate, seed=args.seed) as llm:
+        app, _ = load_app(llm.base_url)
+        run = asyncio.run(run_benchmark(app, args.listings, args.concurrency, args.image_size, args.seed))
+        report = build_report(run, llm, args.listings, args.concurrency)
+
+    print_report(report)
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()